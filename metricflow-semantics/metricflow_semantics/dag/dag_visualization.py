@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TypeVar
-
-import graphviz
+from typing import TYPE_CHECKING, TypeVar
 
 from metricflow_semantics.dag.mf_dag import DagNode, MetricFlowDag
 from metricflow_semantics.random_id import random_id
 
+if TYPE_CHECKING:
+    import graphviz
+
 logger = logging.getLogger(__name__)
 DagNodeT = TypeVar("DagNodeT", bound=DagNode)
 
@@ -44,6 +45,10 @@ def render_via_graphviz(dag_graph: DagGraphT, file_path_without_svg_suffix: str)
         dag_graph: The DAG to render.
         file_path_without_svg_suffix: Path to the SVG file that should be created, without ".svg" suffix.
     """
+    # graphviz is only needed when a DAG is displayed, so it's imported here to keep it out of the import path of the
+    # CLI and tests.
+    import graphviz
+
     dot = graphviz.Digraph(comment=dag_graph.dag_id, node_attr={"shape": "box", "fontname": "Courier"})
     # Not quite correct if there are shared nodes.
     for sink_node in dag_graph.sink_nodes:
@@ -34,18 +34,36 @@ class MetricLookup:
             semantic_manifest: used to fetch and load the metrics and initialize the linkable spec resolver
             semantic_model_lookup: provides access to semantic model metadata for various lookup operations
         """
-        self._metrics: Dict[MetricReference, Metric] = {}
+        # Keyed by the metric name to avoid hashing a reference object for each lookup.
+        self._metrics_by_name: Dict[str, Metric] = {}
+        # Names of cumulative metrics and derived metrics with a time offset on an input metric.
+        self._cumulative_or_time_offset_metric_names: Set[str] = set()
         self._semantic_model_lookup = semantic_model_lookup
+        self._known_measure_references: FrozenSet[MeasureReference] = frozenset(
+            semantic_model_lookup.measure_references
+        )
 
         for metric in semantic_manifest.metrics:
             self._add_metric(metric)
-
-        self._linkable_spec_resolver = ValidLinkableSpecResolver(
-            semantic_manifest=semantic_manifest,
-            semantic_model_lookup=semantic_model_lookup,
-            max_entity_links=MAX_JOIN_HOPS,
+        self._metric_references = tuple(
+            MetricReference(element_name=metric_name) for metric_name in self._metrics_by_name
         )
 
+        self._semantic_manifest = semantic_manifest
+        # Building the resolver walks the join paths of all semantic models, so it's deferred until a linkable element
+        # lookup is made.
+        self._linkable_spec_resolver: Optional[ValidLinkableSpecResolver] = None
+
+    @property
+    def _resolver(self) -> ValidLinkableSpecResolver:
+        if self._linkable_spec_resolver is None:
+            self._linkable_spec_resolver = ValidLinkableSpecResolver(
+                semantic_manifest=self._semantic_manifest,
+                semantic_model_lookup=self._semantic_model_lookup,
+                max_entity_links=MAX_JOIN_HOPS,
+            )
+        return self._linkable_spec_resolver
+
     @functools.lru_cache
     def linkable_elements_for_measure(
         self,
@@ -58,7 +76,7 @@ class MetricLookup:
         frozen_without_any_of = frozenset() if without_any_of is None else without_any_of
 
         start_time = time.time()
-        linkable_element_set = self._linkable_spec_resolver.get_linkable_element_set_for_measure(
+        linkable_element_set = self._resolver.get_linkable_element_set_for_measure(
             measure_reference=measure_reference,
             with_any_of=frozen_with_any_of,
             without_any_of=frozen_without_any_of,
@@ -79,7 +97,7 @@ class MetricLookup:
         frozen_with_any_of = LinkableElementProperty.all_properties() if with_any_of is None else with_any_of
         frozen_without_any_of = frozenset() if without_any_of is None else without_any_of
 
-        return self._linkable_spec_resolver.get_linkable_elements_for_distinct_values_query(
+        return self._resolver.get_linkable_elements_for_distinct_values_query(
             with_any_of=frozen_with_any_of,
             without_any_of=frozen_without_any_of,
         )
@@ -92,7 +110,7 @@ class MetricLookup:
         without_any_property: FrozenSet[LinkableElementProperty] = frozenset(),
     ) -> LinkableElementSet:
         """Retrieve the matching set of linkable elements common to all metrics requested (intersection)."""
-        return self._linkable_spec_resolver.get_linkable_elements_for_metrics(
+        return self._resolver.get_linkable_elements_for_metrics(
             metric_references=metric_references,
             with_any_of=with_any_property,
             without_any_of=without_any_property,
@@ -101,34 +119,43 @@ class MetricLookup:
     def get_metrics(self, metric_references: Sequence[MetricReference]) -> Sequence[Metric]:  # noqa: D102
         res = []
         for metric_reference in metric_references:
-            if metric_reference not in self._metrics:
+            metric = self._metrics_by_name.get(metric_reference.element_name)
+            if metric is None:
                 raise MetricNotFoundError(
                     f"Unable to find metric `{metric_reference}`. Perhaps it has not been registered"
                 )
-            res.append(self._metrics[metric_reference])
+            res.append(metric)
 
         return res
 
     @property
     def metric_references(self) -> Sequence[MetricReference]:  # noqa: D102
-        return list(self._metrics.keys())
+        return self._metric_references
 
     def get_metric(self, metric_reference: MetricReference) -> Metric:  # noqa: D102
-        if metric_reference not in self._metrics:
+        metric = self._metrics_by_name.get(metric_reference.element_name)
+        if metric is None:
             raise MetricNotFoundError(f"Unable to find metric `{metric_reference}`. Perhaps it has not been registered")
-        return self._metrics[metric_reference]
+        return metric
 
     def _add_metric(self, metric: Metric) -> None:
         """Add metric, validating presence of required measures."""
-        metric_reference = MetricReference(element_name=metric.name)
-        if metric_reference in self._metrics:
+        if metric.name in self._metrics_by_name:
             raise DuplicateMetricError(f"Metric `{metric.name}` has already been registered")
         for measure_reference in metric.measure_references:
-            if measure_reference not in self._semantic_model_lookup.measure_references:
+            if measure_reference not in self._known_measure_references:
                 raise NonExistentMeasureError(
                     f"Metric `{metric.name}` references measure `{measure_reference}` which has not been registered"
                 )
-        self._metrics[metric_reference] = metric
+        self._metrics_by_name[metric.name] = metric
+
+        if metric.type is MetricType.CUMULATIVE:
+            self._cumulative_or_time_offset_metric_names.add(metric.name)
+        elif metric.type is MetricType.DERIVED:
+            for input_metric in metric.type_params.metrics or []:
+                if input_metric.offset_window or input_metric.offset_to_grain:
+                    self._cumulative_or_time_offset_metric_names.add(metric.name)
+                    break
 
     def configured_input_measure_for_metric(  # noqa: D102
         self, metric_reference: MetricReference
@@ -147,19 +174,23 @@ class MetricLookup:
     def contains_cumulative_or_time_offset_metric(self, metric_references: Sequence[MetricReference]) -> bool:
         """Returns true if any of the specs correspond to a cumulative metric or a derived metric with time offset."""
         for metric_reference in metric_references:
-            metric = self.get_metric(metric_reference)
-            if metric.type == MetricType.CUMULATIVE:
+            if metric_reference.element_name not in self._metrics_by_name:
+                raise MetricNotFoundError(
+                    f"Unable to find metric `{metric_reference}`. Perhaps it has not been registered"
+                )
+            if metric_reference.element_name in self._cumulative_or_time_offset_metric_names:
                 return True
-            elif metric.type == MetricType.DERIVED:
-                for input_metric in metric.type_params.metrics or []:
-                    if input_metric.offset_window or input_metric.offset_to_grain:
-                        return True
         return False
 
+    @functools.lru_cache
     def _get_agg_time_dimension_specs_for_metric(
         self, metric_reference: MetricReference
     ) -> Sequence[TimeDimensionSpec]:
-        """Retrieves the aggregate time dimensions associated with the metric's measures."""
+        """Retrieves the aggregate time dimensions associated with the metric's measures.
+
+        This is cached as it's called for each metric in a query, and it generates the specs for all possible
+        granularities / date parts of the agg time dimension of each input measure.
+        """
         metric = self.get_metric(metric_reference)
         specs: Set[TimeDimensionSpec] = set()
         for input_measure in metric.input_measures:
@@ -167,7 +198,7 @@ class MetricLookup:
                 measure_reference=input_measure.measure_reference
             )
             specs.update(time_dimension_specs)
-        return list(specs)
+        return tuple(specs)
 
     def get_valid_agg_time_dimensions_for_metric(
         self, metric_reference: MetricReference
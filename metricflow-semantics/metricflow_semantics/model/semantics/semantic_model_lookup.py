@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
-from typing import Dict, List, Optional, Sequence, Set
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from dbt_semantic_interfaces.protocols.dimension import Dimension
 from dbt_semantic_interfaces.protocols.entity import Entity
@@ -56,6 +55,14 @@ class SemanticModelLookup:
         self._dimension_index: Dict[DimensionReference, List[SemanticModel]] = {}
         self._entity_index: Dict[EntityReference, List[SemanticModel]] = {}
 
+        # Direct lookups to the model objects to avoid scanning the elements in a semantic model.
+        self._measure_reference_to_measure: Dict[MeasureReference, Measure] = {}
+        self._dimension_reference_to_dimension: Dict[DimensionReference, Dimension] = {}
+        self._semantic_model_element_reference_to_entity: Dict[SemanticModelElementReference, Entity] = {}
+        self._semantic_model_to_validity_window_dimensions: Dict[
+            SemanticModelReference, Tuple[Dimension, Dimension]
+        ] = {}
+
         self._dimension_ref_to_spec: Dict[DimensionReference, DimensionSpec] = {}
         self._entity_ref_to_spec: Dict[EntityReference, EntitySpec] = {}
 
@@ -67,9 +74,14 @@ class SemanticModelLookup:
         for semantic_model in sorted(model.semantic_models, key=lambda semantic_model: semantic_model.name):
             self._add_semantic_model(semantic_model)
 
+        # The semantic models don't change after initialization, so the references can be computed once.
+        self._measure_references: Tuple[MeasureReference, ...] = tuple(self._measure_index.keys())
+        self._dimension_references: Tuple[DimensionReference, ...] = tuple(self._dimension_index.keys())
+        self._entity_references: Tuple[EntityReference, ...] = tuple(self._entity_index.keys())
+
     def get_dimension_references(self) -> Sequence[DimensionReference]:
         """Retrieve all dimension references from the collection of semantic models."""
-        return tuple(self._dimension_index.keys())
+        return self._dimension_references
 
     @staticmethod
     def get_dimension_from_semantic_model(
@@ -88,19 +100,18 @@ class SemanticModelLookup:
         # If the reference passed is a TimeDimensionReference, convert to DimensionReference.
         dimension_reference = DimensionReference(dimension_reference.element_name)
 
-        semantic_models = self._dimension_index.get(dimension_reference)
-        if not semantic_models:
+        # Dimension object should match across semantic models, so this maps to the one in the first semantic model.
+        dimension = self._dimension_reference_to_dimension.get(dimension_reference)
+        if dimension is None:
             raise ValueError(
                 f"Could not find dimension with name '{dimension_reference.element_name}' in configured semantic models"
             )
 
-        dimension = SemanticModelLookup.get_dimension_from_semantic_model(
-            # Dimension object should match across semantic models, so just use the first semantic model.
-            semantic_model=semantic_models[0],
-            dimension_reference=dimension_reference,
-        )
-        # TODO: Unclear if the deepcopy is necessary.
-        return deepcopy(dimension)
+        return dimension
+
+    def is_partition_dimension(self, dimension_reference: DimensionReference) -> bool:
+        """Returns true if the dimension is defined as a partition."""
+        return self.get_dimension(dimension_reference).is_partition
 
     def get_time_dimension(self, time_dimension_reference: TimeDimensionReference) -> Dimension:
         """Retrieves a full dimension object by name."""
@@ -109,7 +120,7 @@ class SemanticModelLookup:
     @property
     def measure_references(self) -> Sequence[MeasureReference]:
         """Return all measure references from the collection of semantic models."""
-        return list(self._measure_index.keys())
+        return self._measure_references
 
     @property
     def non_additive_dimension_specs_by_measure(self) -> Dict[MeasureReference, NonAdditiveDimensionSpec]:
@@ -132,16 +143,15 @@ class SemanticModelLookup:
 
     def get_measure(self, measure_reference: MeasureReference) -> Measure:
         """Retrieve the measure model object associated with the measure reference."""
-        if measure_reference not in self._measure_index:
+        measure = self._measure_reference_to_measure.get(measure_reference)
+        if measure is None:
             raise ValueError(f"Could not find measure with name ({measure_reference}) in configured semantic models")
 
-        return SemanticModelLookup.get_measure_from_semantic_model(
-            semantic_model=self.get_semantic_model_for_measure(measure_reference), measure_reference=measure_reference
-        )
+        return measure
 
     def get_entity_references(self) -> Sequence[EntityReference]:
         """Retrieve all entity references from the collection of semantic models."""
-        return list(self._entity_index.keys())
+        return self._entity_references
 
     def get_semantic_model_for_measure(self, measure_reference: MeasureReference) -> SemanticModel:  # noqa: D102
         semantic_model = self._measure_index.get(measure_reference)
@@ -161,20 +171,18 @@ class SemanticModelLookup:
 
     def get_entity_in_semantic_model(self, ref: SemanticModelElementReference) -> Optional[Entity]:
         """Retrieve the entity matching the element -> semantic model mapping, if any."""
-        semantic_model = self.get_by_reference(ref.semantic_model_reference)
-        if not semantic_model:
-            return None
-
-        for entity in semantic_model.entities:
-            if entity.reference.element_name == ref.element_name:
-                return entity
-
-        return None
+        return self._semantic_model_element_reference_to_entity.get(ref)
 
     def get_by_reference(self, semantic_model_reference: SemanticModelReference) -> Optional[SemanticModel]:
         """Retrieve the semantic model object matching the input semantic model reference, if any."""
         return self._semantic_model_reference_to_semantic_model.get(semantic_model_reference)
 
+    def get_validity_window_dimensions(
+        self, semantic_model_reference: SemanticModelReference
+    ) -> Optional[Tuple[Dimension, Dimension]]:
+        """Return the (start, end) dimensions defining the validity window of a semantic model, if both exist."""
+        return self._semantic_model_to_validity_window_dimensions.get(semantic_model_reference)
+
     def _add_semantic_model(self, semantic_model: SemanticModel) -> None:
         """Add semantic model semantic information, validating consistency with existing semantic models."""
         errors = []
@@ -199,6 +207,7 @@ class SemanticModelLookup:
         for measure in semantic_model.measures:
             self._measure_aggs[measure.reference] = measure.agg
             self._measure_index[measure.reference] = semantic_model
+            self._measure_reference_to_measure[measure.reference] = measure
             agg_time_dimension_reference = semantic_model.checked_agg_time_dimension_for_measure(measure.reference)
 
             matching_dimensions = tuple(
@@ -240,9 +249,19 @@ class SemanticModelLookup:
                     window_groupings=tuple(measure.non_additive_dimension.window_groupings),
                 )
                 self._measure_non_additive_dimension_specs[measure.reference] = non_additive_dimension_spec
+        validity_start_dimensions: List[Dimension] = []
+        validity_end_dimensions: List[Dimension] = []
         for dim in semantic_model.dimensions:
+            if dim.validity_params is not None:
+                if dim.validity_params.is_start:
+                    validity_start_dimensions.append(dim)
+                if dim.validity_params.is_end:
+                    validity_end_dimensions.append(dim)
+
             semantic_models_for_dimension = self._dimension_index.get(dim.reference, []) + [semantic_model]
             self._dimension_index[dim.reference] = semantic_models_for_dimension
+            if dim.reference not in self._dimension_reference_to_dimension:
+                self._dimension_reference_to_dimension[dim.reference] = dim
 
             self._dimension_ref_to_spec[dim.time_dimension_reference or dim.reference] = (
                 TimeDimensionSpec.from_name(dim.name)
@@ -250,9 +269,24 @@ class SemanticModelLookup:
                 else DimensionSpec.from_name(dim.name)
             )
 
+        assert (
+            len(validity_start_dimensions) <= 1
+        ), "Found more than one validity start dimension. This should have been blocked in validation!"
+        assert (
+            len(validity_end_dimensions) <= 1
+        ), "Found more than one validity end dimension. This should have been blocked in validation!"
+        if validity_start_dimensions and validity_end_dimensions:
+            self._semantic_model_to_validity_window_dimensions[semantic_model.reference] = (
+                validity_start_dimensions[0],
+                validity_end_dimensions[0],
+            )
+
         for entity in semantic_model.entities:
             semantic_models_for_entity = self._entity_index.get(entity.reference, []) + [semantic_model]
             self._entity_index[entity.reference] = semantic_models_for_entity
+            self._semantic_model_element_reference_to_entity[
+                SemanticModelElementReference.create_from_references(semantic_model.reference, entity.reference)
+            ] = entity
 
             self._entity_ref_to_spec[entity.reference] = EntitySpec.from_name(entity.name)
 
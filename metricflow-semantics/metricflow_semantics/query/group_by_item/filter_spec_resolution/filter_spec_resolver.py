@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
 from typing import List, Sequence
 
 from dbt_semantic_interfaces.call_parameter_sets import FilterCallParameterSets, MetricCallParameterSet
-from dbt_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilterIntersection
+from dbt_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticWhereFilter,
+    PydanticWhereFilterIntersection,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_parser import WhereFilterParser
 from dbt_semantic_interfaces.protocols import WhereFilter, WhereFilterIntersection
 from dbt_semantic_interfaces.references import EntityReference
 from typing_extensions import override
@@ -51,6 +56,16 @@ from metricflow_semantics.query.issues.issues_base import (
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_call_parameter_sets(where_sql_template: str) -> FilterCallParameterSets:
+    """Parse the call parameter sets in the template, caching the result as the parse renders the Jinja template.
+
+    The same filters are seen repeatedly as a metric's filter is checked for each query that uses the metric, and for
+    each path to the metric in a query. Templates that fail to parse are not cached and raise on each call.
+    """
+    return WhereFilterParser.parse_call_parameter_sets(where_sql_template)
+
+
 class WhereFilterSpecResolver:
     """Resolves the specs for the (ambiguous) group-by-items that are in where filters of the resolution DAG.
 
@@ -317,7 +332,12 @@ class _ResolveWhereFilterSpecVisitor(GroupByItemResolutionNodeVisitor[FilterSpec
 
         for where_filter in where_filter_intersection.where_filters:
             try:
-                filter_call_parameter_sets = where_filter.call_parameter_sets
+                # The cached parse is equivalent to `PydanticWhereFilter.call_parameter_sets`. Other implementations
+                # of the protocol may compute the parameter sets differently, so use the property for those.
+                if isinstance(where_filter, PydanticWhereFilter):
+                    filter_call_parameter_sets = _parse_call_parameter_sets(where_filter.where_sql_template)
+                else:
+                    filter_call_parameter_sets = where_filter.call_parameter_sets
             except Exception as e:
                 non_parsable_resolutions.append(
                     NonParsableFilterResolution(
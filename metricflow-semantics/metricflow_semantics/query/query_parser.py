@@ -432,7 +432,12 @@ class MetricFlowQueryParser:
         where_filters: List[PydanticWhereFilter] = []
 
         if where_constraint is not None:
-            where_filters.append(PydanticWhereFilter(where_sql_template=where_constraint.where_sql_template))
+            # Avoid re-validating the filter if it's already a pydantic object.
+            where_filters.append(
+                where_constraint
+                if isinstance(where_constraint, PydanticWhereFilter)
+                else PydanticWhereFilter(where_sql_template=where_constraint.where_sql_template)
+            )
         if where_constraint_str is not None:
             where_filters.append(PydanticWhereFilter(where_sql_template=where_constraint_str))
 
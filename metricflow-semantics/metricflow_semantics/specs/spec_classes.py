@@ -11,6 +11,7 @@ TODO: Split this file into separate files.
 
 from __future__ import annotations
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -685,10 +686,14 @@ class WhereFilterSpec(Mergeable, SerializableDataclass):
     linkable_elements: Tuple[LinkableElement, ...]
 
     def merge(self, other: WhereFilterSpec) -> WhereFilterSpec:  # noqa: D102
-        if self == WhereFilterSpec.empty_instance():
+        if self is other:
+            return self
+
+        empty_instance = WhereFilterSpec.empty_instance()
+        if self == empty_instance:
             return other
 
-        if other == WhereFilterSpec.empty_instance():
+        if other == empty_instance:
             return self
 
         if self == other:
@@ -703,7 +708,9 @@ class WhereFilterSpec(Mergeable, SerializableDataclass):
 
     @classmethod
     @override
+    @functools.lru_cache
     def empty_instance(cls) -> WhereFilterSpec:
+        # The instance is immutable, so the same one is returned to avoid constructing one for every merge.
         # Need to revisit making WhereFilterSpec Mergeable as it's current not a collection, and it's odd to return this
         # no-op filter. Use cases would need to check whether a WhereSpec is a no-op before rendering it to avoid an
         # un-necessary WHERE clause. Making WhereFilterSpec map to a WhereFilterIntersection would make this more in
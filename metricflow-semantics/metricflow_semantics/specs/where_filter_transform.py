@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import jinja2
 from dbt_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilterIntersection
@@ -28,6 +29,15 @@ class RenderSqlTemplateException(Exception):  # noqa: D101
     pass
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_where_sql_template(where_sql_template: str) -> jinja2.Template:
+    """Compile the template, caching the result as the same filter is rendered for each node / query that uses it.
+
+    Rendering a compiled template doesn't modify it, so the template can be shared.
+    """
+    return jinja2.Template(where_sql_template, undefined=jinja2.StrictUndefined)
+
+
 class WhereSpecFactory:
     """Renders the SQL template in the WhereFilter and converts it to a WhereFilterSpec."""
 
@@ -38,6 +48,9 @@ class WhereSpecFactory:
     ) -> None:
         self._column_association_resolver = column_association_resolver
         self._spec_resolution_lookup = spec_resolution_lookup
+        # The same filter can be seen multiple times while building a plan (e.g. a metric filter is applied to each
+        # input measure), so cache the rendered spec by the location and the template.
+        self._filter_spec_cache: Dict[Tuple[WhereFilterLocation, str], WhereFilterSpec] = {}
 
     def create_from_where_filter(  # noqa: D102
         self,
@@ -60,57 +73,63 @@ class WhereSpecFactory:
         filter_specs: List[WhereFilterSpec] = []
 
         for where_filter in filter_intersection.where_filters:
-            rendered_spec_tracker = RenderedSpecTracker()
-            dimension_factory = WhereFilterDimensionFactory(
-                column_association_resolver=self._column_association_resolver,
-                spec_resolution_lookup=self._spec_resolution_lookup,
-                where_filter_location=filter_location,
-                rendered_spec_tracker=rendered_spec_tracker,
-            )
-            time_dimension_factory = WhereFilterTimeDimensionFactory(
-                column_association_resolver=self._column_association_resolver,
-                spec_resolution_lookup=self._spec_resolution_lookup,
-                where_filter_location=filter_location,
-                rendered_spec_tracker=rendered_spec_tracker,
-            )
-            entity_factory = WhereFilterEntityFactory(
-                column_association_resolver=self._column_association_resolver,
-                spec_resolution_lookup=self._spec_resolution_lookup,
-                where_filter_location=filter_location,
-                rendered_spec_tracker=rendered_spec_tracker,
-            )
-            metric_factory = WhereFilterMetricFactory(
-                column_association_resolver=self._column_association_resolver,
-                spec_resolution_lookup=self._spec_resolution_lookup,
-                where_filter_location=filter_location,
-                rendered_spec_tracker=rendered_spec_tracker,
-            )
-            try:
-                # If there was an error with the template, it should have been caught while resolving the specs for
-                # the filters during query resolution.
-                where_sql = jinja2.Template(where_filter.where_sql_template, undefined=jinja2.StrictUndefined).render(
-                    {
-                        "Dimension": dimension_factory.create,
-                        "TimeDimension": time_dimension_factory.create,
-                        "Entity": entity_factory.create,
-                        "Metric": metric_factory.create,
-                    }
-                )
-            except (jinja2.exceptions.UndefinedError, jinja2.exceptions.TemplateSyntaxError) as e:
-                raise RenderSqlTemplateException(
-                    f"Error while rendering Jinja template:\n{where_filter.where_sql_template}"
-                ) from e
-            rendered_specs = tuple(result[0] for result in rendered_spec_tracker.rendered_specs_to_elements)
-            linkable_elements = tuple(
-                itertools.chain.from_iterable(result[1] for result in rendered_spec_tracker.rendered_specs_to_elements)
-            )
-            filter_specs.append(
-                WhereFilterSpec(
-                    where_sql=where_sql,
-                    bind_parameters=SqlBindParameters(),
-                    linkable_specs=rendered_specs,
-                    linkable_elements=linkable_elements,
-                )
-            )
+            cache_key = (filter_location, where_filter.where_sql_template)
+            filter_spec = self._filter_spec_cache.get(cache_key)
+            if filter_spec is None:
+                filter_spec = self._render_where_filter(filter_location=filter_location, where_filter=where_filter)
+                self._filter_spec_cache[cache_key] = filter_spec
+            filter_specs.append(filter_spec)
 
         return filter_specs
+
+    def _render_where_filter(self, filter_location: WhereFilterLocation, where_filter: WhereFilter) -> WhereFilterSpec:
+        rendered_spec_tracker = RenderedSpecTracker()
+        dimension_factory = WhereFilterDimensionFactory(
+            column_association_resolver=self._column_association_resolver,
+            spec_resolution_lookup=self._spec_resolution_lookup,
+            where_filter_location=filter_location,
+            rendered_spec_tracker=rendered_spec_tracker,
+        )
+        time_dimension_factory = WhereFilterTimeDimensionFactory(
+            column_association_resolver=self._column_association_resolver,
+            spec_resolution_lookup=self._spec_resolution_lookup,
+            where_filter_location=filter_location,
+            rendered_spec_tracker=rendered_spec_tracker,
+        )
+        entity_factory = WhereFilterEntityFactory(
+            column_association_resolver=self._column_association_resolver,
+            spec_resolution_lookup=self._spec_resolution_lookup,
+            where_filter_location=filter_location,
+            rendered_spec_tracker=rendered_spec_tracker,
+        )
+        metric_factory = WhereFilterMetricFactory(
+            column_association_resolver=self._column_association_resolver,
+            spec_resolution_lookup=self._spec_resolution_lookup,
+            where_filter_location=filter_location,
+            rendered_spec_tracker=rendered_spec_tracker,
+        )
+        try:
+            # If there was an error with the template, it should have been caught while resolving the specs for
+            # the filters during query resolution.
+            where_sql = _compile_where_sql_template(where_filter.where_sql_template).render(
+                {
+                    "Dimension": dimension_factory.create,
+                    "TimeDimension": time_dimension_factory.create,
+                    "Entity": entity_factory.create,
+                    "Metric": metric_factory.create,
+                }
+            )
+        except (jinja2.exceptions.UndefinedError, jinja2.exceptions.TemplateSyntaxError) as e:
+            raise RenderSqlTemplateException(
+                f"Error while rendering Jinja template:\n{where_filter.where_sql_template}"
+            ) from e
+        rendered_specs = tuple(result[0] for result in rendered_spec_tracker.rendered_specs_to_elements)
+        linkable_elements = tuple(
+            itertools.chain.from_iterable(result[1] for result in rendered_spec_tracker.rendered_specs_to_elements)
+        )
+        return WhereFilterSpec(
+            where_sql=where_sql,
+            bind_parameters=SqlBindParameters(),
+            linkable_specs=rendered_specs,
+            linkable_elements=linkable_elements,
+        )
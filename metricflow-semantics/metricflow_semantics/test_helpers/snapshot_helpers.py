@@ -76,12 +76,15 @@ def assert_snapshot_text_equal(
         with open(file_path, "w") as snapshot_text_file:
             snapshot_text_file.write(snapshot_text)
 
-    # Throw an exception if the plan is not there.
-    if not os.path.exists(file_path):
+    # Read the existing plan from the file. Throw an exception if the plan is not there.
+    try:
+        with open(file_path, "r") as snapshot_text_file:
+            expected_snapshot_text = snapshot_text_file.read()
+    except FileNotFoundError as e:
         raise FileNotFoundError(
             f"Could not find snapshot file at path {file_path}. Re-run with --overwrite-snapshots and check git status "
             "to see what's new."
-        )
+        ) from e
 
     if mf_test_configuration.display_snapshots:
         if not mf_test_configuration.overwrite_snapshots:
@@ -91,28 +94,25 @@ def assert_snapshot_text_equal(
             raise ValueError("Displaying snapshots is only supported when there's a single item in a testing session.")
         webbrowser.open("file://" + file_path)
 
-    # Read the existing plan from the file and compare with the actual plan
-    with open(file_path, "r") as snapshot_text_file:
-        expected_snapshot_text = snapshot_text_file.read()
-
-        if exclude_line_regex:
-            # Filter out lines that should be ignored.
-            expected_snapshot_text = _exclude_lines_matching_regex(
-                file_contents=expected_snapshot_text, exclude_line_regex=exclude_line_regex
-            )
-            snapshot_text = _exclude_lines_matching_regex(
-                file_contents=snapshot_text, exclude_line_regex=exclude_line_regex
-            )
-        # pytest should show a detailed diff with "assert actual_modified == expected_modified", but it's not, so doing
-        # this instead.
-        if snapshot_text != expected_snapshot_text:
-            diff = difflib.unified_diff(
-                a=expected_snapshot_text.splitlines(keepends=True),
-                b=snapshot_text.splitlines(keepends=True),
-                fromfile=f"Expected Result in {file_path}",
-                tofile="Actual Result",
-            )
-            assert False, "Result does not match the stored snapshot. Diff from expected to actual:\n\n" + "".join(diff)
+    # Compare the existing plan with the actual plan.
+    if exclude_line_regex:
+        # Filter out lines that should be ignored.
+        expected_snapshot_text = _exclude_lines_matching_regex(
+            file_contents=expected_snapshot_text, exclude_line_regex=exclude_line_regex
+        )
+        snapshot_text = _exclude_lines_matching_regex(
+            file_contents=snapshot_text, exclude_line_regex=exclude_line_regex
+        )
+    # pytest should show a detailed diff with "assert actual_modified == expected_modified", but it's not, so doing
+    # this instead.
+    if snapshot_text != expected_snapshot_text:
+        diff = difflib.unified_diff(
+            a=expected_snapshot_text.splitlines(keepends=True),
+            b=snapshot_text.splitlines(keepends=True),
+            fromfile=f"Expected Result in {file_path}",
+            tofile="Actual Result",
+        )
+        assert False, "Result does not match the stored snapshot. Diff from expected to actual:\n\n" + "".join(diff)
 
 
 def snapshot_path_prefix(
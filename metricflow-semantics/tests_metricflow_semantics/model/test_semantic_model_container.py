@@ -6,6 +6,7 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 from dbt_semantic_interfaces.references import EntityReference, MeasureReference, MetricReference
+from metricflow_semantics.errors.error_classes import MetricNotFoundError
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
 from metricflow_semantics.model.semantics.metric_lookup import MetricLookup
 from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
@@ -229,3 +230,15 @@ def test_get_agg_time_dimension_specs_for_measure(semantic_model_lookup: Semanti
         agg_time_dim_reference = semantic_model_lookup.get_agg_time_dimension_for_measure(measure_reference)
         for spec in agg_time_dim_specs:
             assert spec.reference == agg_time_dim_reference
+
+
+def test_contains_cumulative_or_time_offset_metric(metric_lookup: MetricLookup) -> None:  # noqa: D103
+    assert metric_lookup.contains_cumulative_or_time_offset_metric((MetricReference("revenue_all_time"),))
+    assert metric_lookup.contains_cumulative_or_time_offset_metric(
+        (MetricReference("bookings"), MetricReference("booking_fees_last_week_per_booker_this_week"))
+    )
+    assert not metric_lookup.contains_cumulative_or_time_offset_metric(
+        (MetricReference("bookings"), MetricReference("booking_fees_per_booker"))
+    )
+    with pytest.raises(MetricNotFoundError):
+        metric_lookup.contains_cumulative_or_time_offset_metric((MetricReference("this_metric_does_not_exist"),))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import time
 from dataclasses import dataclass
@@ -11,6 +12,7 @@ from dbt_semantic_interfaces.protocols.metric import (
     ConstantPropertyInput,
     ConversionTypeParams,
     Metric,
+    MetricInput,
     MetricInputMeasure,
     MetricTimeWindow,
     MetricType,
@@ -134,6 +136,9 @@ class DataflowPlanBuilder:
     ) -> None:
         self._semantic_model_lookup = semantic_manifest_lookup.semantic_model_lookup
         self._metric_lookup = semantic_manifest_lookup.metric_lookup
+        self._non_additive_dimension_specs_by_measure = (
+            self._semantic_model_lookup.non_additive_dimension_specs_by_measure
+        )
         self._metric_time_dimension_reference = DataSet.metric_time_dimension_reference()
         self._source_node_set = source_node_set
         self._column_association_resolver = column_association_resolver
@@ -1206,7 +1211,7 @@ class DataflowPlanBuilder:
 
         measure_spec = MeasureSpec(
             element_name=input_measure.name,
-            non_additive_dimension_spec=self._semantic_model_lookup.non_additive_dimension_specs_by_measure.get(
+            non_additive_dimension_spec=self._non_additive_dimension_specs_by_measure.get(
                 input_measure.measure_reference
             ),
         )
@@ -1258,16 +1263,18 @@ class DataflowPlanBuilder:
         descendent_filter_specs: Sequence[WhereFilterSpec],
     ) -> Tuple[WhereFilterSpec, ...]:
         metric_reference = MetricReference(element_name=metric.name)
-        filter_specs: List[WhereFilterSpec] = []
         filter_location = WhereFilterLocation.for_metric(metric_reference)
-        for filter_ in (input_measure.filter, metric.filter):
-            filter_specs.extend(
+        return tuple(
+            itertools.chain(
                 filter_spec_factory.create_from_where_filter_intersection(
-                    filter_location=filter_location, filter_intersection=filter_
-                )
+                    filter_location=filter_location, filter_intersection=input_measure.filter
+                ),
+                filter_spec_factory.create_from_where_filter_intersection(
+                    filter_location=filter_location, filter_intersection=metric.filter
+                ),
+                descendent_filter_specs,
             )
-        filter_specs.extend(descendent_filter_specs)
-        return tuple(filter_specs)
+        )
 
     def _build_input_metric_specs_for_derived_metric(
         self,
@@ -1276,30 +1283,33 @@ class DataflowPlanBuilder:
     ) -> Sequence[MetricSpec]:
         """Return the metric specs referenced by the metric. Current use case is for derived metrics."""
         metric = self._metric_lookup.get_metric(metric_reference)
-        input_metric_specs: List[MetricSpec] = []
-
-        for input_metric in metric.input_metrics:
-            filter_specs = filter_spec_factory.create_from_where_filter_intersection(
-                filter_location=WhereFilterLocation.for_metric(input_metric.as_reference),
-                filter_intersection=input_metric.filter,
-            )
-
-            spec = MetricSpec(
-                element_name=input_metric.name,
-                filter_specs=tuple(filter_specs),
-                alias=input_metric.alias,
-                offset_window=(
-                    PydanticMetricTimeWindow(
-                        count=input_metric.offset_window.count,
-                        granularity=input_metric.offset_window.granularity,
-                    )
-                    if input_metric.offset_window
-                    else None
-                ),
-                offset_to_grain=input_metric.offset_to_grain,
-            )
-            input_metric_specs.append(spec)
-        return tuple(input_metric_specs)
+        return tuple(
+            self._build_input_metric_spec(filter_spec_factory=filter_spec_factory, input_metric=input_metric)
+            for input_metric in metric.input_metrics
+        )
+
+    @staticmethod
+    def _build_input_metric_spec(filter_spec_factory: WhereSpecFactory, input_metric: MetricInput) -> MetricSpec:
+        """Return the spec for one of the input metrics of a derived metric."""
+        filter_specs = filter_spec_factory.create_from_where_filter_intersection(
+            filter_location=WhereFilterLocation.for_metric(input_metric.as_reference),
+            filter_intersection=input_metric.filter,
+        )
+
+        return MetricSpec(
+            element_name=input_metric.name,
+            filter_specs=tuple(filter_specs),
+            alias=input_metric.alias,
+            offset_window=(
+                PydanticMetricTimeWindow(
+                    count=input_metric.offset_window.count,
+                    granularity=input_metric.offset_window.granularity,
+                )
+                if input_metric.offset_window
+                else None
+            ),
+            offset_to_grain=input_metric.offset_to_grain,
+        )
 
     def build_aggregated_measure(
         self,
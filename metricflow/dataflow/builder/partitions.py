@@ -40,15 +40,13 @@ class PartitionJoinResolver:
     def _get_partitions(self, spec_set: InstanceSpecSet) -> PartitionSpecSet:
         """Returns the specs from the instance set that correspond to partition specs."""
         partition_dimension_specs = tuple(
-            x
-            for x in spec_set.dimension_specs
-            if self._semantic_model_lookup.get_dimension(dimension_reference=x.reference).is_partition
+            x for x in spec_set.dimension_specs if self._semantic_model_lookup.is_partition_dimension(x.reference)
         )
         partition_time_dimension_specs = tuple(
             x
             for x in spec_set.time_dimension_specs
             if x.reference != DataSet.metric_time_dimension_reference()
-            and self._semantic_model_lookup.get_time_dimension(time_dimension_reference=x.reference).is_partition
+            and self._semantic_model_lookup.is_partition_dimension(x.reference)
         )
 
         return PartitionSpecSet(
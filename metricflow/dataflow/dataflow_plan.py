@@ -5,12 +5,14 @@ from __future__ import annotations
 import logging
 import typing
 from abc import ABC, abstractmethod
-from typing import FrozenSet, Generic, Optional, Sequence, Set, Type, TypeVar
+from typing import Dict, FrozenSet, Generic, Optional, Sequence, Set, Type, TypeVar
 
 import more_itertools
+from metricflow_semantics.dag.dag_to_text import MetricFlowDagTextFormatter
 from metricflow_semantics.dag.id_prefix import StaticIdPrefix
 from metricflow_semantics.dag.mf_dag import DagId, DagNode, MetricFlowDag, NodeId
 from metricflow_semantics.visitor import Visitable, VisitorOutputT
+from typing_extensions import override
 
 if typing.TYPE_CHECKING:
     from dbt_semantic_interfaces.references import SemanticModelReference
@@ -210,6 +212,19 @@ class DataflowPlan(MetricFlowDag[DataflowPlanNode]):
             dag_id=plan_id or DagId.from_id_prefix(StaticIdPrefix.DATAFLOW_PLAN_PREFIX),
             sink_nodes=tuple(sink_nodes),
         )
+        self._formatter_to_structure_text: Dict[MetricFlowDagTextFormatter, str] = {}
+
+    @override
+    def structure_text(self, formatter: MetricFlowDagTextFormatter = MetricFlowDagTextFormatter()) -> str:
+        """Return a text representation that shows the structure of this DAG.
+
+        The plan doesn't change after it's built, so the text is cached for each formatter.
+        """
+        structure_text = self._formatter_to_structure_text.get(formatter)
+        if structure_text is None:
+            structure_text = super().structure_text(formatter)
+            self._formatter_to_structure_text[formatter] = structure_text
+        return structure_text
 
     @property
     def sink_node(self) -> DataflowPlanNode:  # noqa: D102
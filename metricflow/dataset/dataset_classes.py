@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional, Sequence
@@ -49,10 +50,14 @@ class DataSet(ABC):
         return DataSet.metric_time_dimension_reference().element_name
 
     @staticmethod
+    @functools.lru_cache
     def metric_time_dimension_spec(
         time_granularity: TimeGranularity, date_part: Optional[DatePart] = None
     ) -> TimeDimensionSpec:
-        """Spec that corresponds to DataSet.metric_time_dimension_reference."""
+        """Spec that corresponds to DataSet.metric_time_dimension_reference.
+
+        Cached as there are only a handful of possible specs and the spec is immutable.
+        """
         return TimeDimensionSpec(
             element_name=DataSet.metric_time_dimension_reference().element_name,
             entity_links=(),
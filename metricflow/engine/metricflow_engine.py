@@ -5,6 +5,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 from typing import FrozenSet, List, Optional, Sequence, Tuple
 
 from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimensionTypeParams
@@ -626,7 +627,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                             entity_links=path_key.entity_links,
                         )
                     )
-        return sorted(dimensions, key=lambda dimension: dimension.qualified_name)
+        return sorted(dimensions, key=attrgetter("qualified_name"))
 
     def list_dimensions(self) -> List[Dimension]:  # noqa: D102
         """Get full dimension object for all dimensions in the semantic manifest."""
@@ -304,12 +304,12 @@ class CreateValidityWindowJoinDescription(InstanceSetTransform[Optional[Validity
         semantic_model = self._semantic_model_lookup.get_by_reference(semantic_model_reference)
         assert semantic_model, f"Could not find semantic model {semantic_model_reference} after data set conversion!"
 
-        start_dim = semantic_model.validity_start_dimension
-        end_dim = semantic_model.validity_end_dimension
-
-        # We do this instead of relying on has_validity_dimensions because this also does type refinement
-        if not start_dim or not end_dim:
+        validity_window_dimensions = self._semantic_model_lookup.get_validity_window_dimensions(
+            semantic_model_reference
+        )
+        if validity_window_dimensions is None:
             return None
+        start_dim, end_dim = validity_window_dimensions
 
         assert start_dim.type_params, "Typechecker hint - validity info cannot exist without type params"
         assert end_dim.type_params, "Typechecker hint - validity info cannot exist without type params"
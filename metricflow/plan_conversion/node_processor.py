@@ -473,33 +473,33 @@ class PreJoinNodeProcessor:
         multi_hop_join_candidates: List[MultiHopJoinCandidate] = []
         logger.info(f"Creating nodes for {desired_linkable_spec}")
 
-        for first_node_that_could_be_joined in nodes:
+        # Whether a node can be on either side of the join doesn't depend on the node on the other side, so find the
+        # nodes for each side once instead of checking each pair of nodes.
+        # When joining on the entity, the first node needs the first and second entity links.
+        first_nodes_that_could_be_joined = tuple(
+            node
+            for node in nodes
+            if self._node_contains_entity(node=node, entity_reference=desired_linkable_spec.entity_links[0])
+            and self._node_contains_entity(node=node, entity_reference=desired_linkable_spec.entity_links[1])
+        )
+        # If the element name of the linkable spec doesn't exist in the joined data set, then it can't be useful for
+        # obtaining that linkable spec.
+        second_nodes_that_could_be_joined = tuple(
+            node
+            for node in nodes
+            if self._node_contains_entity(node=node, entity_reference=desired_linkable_spec.entity_links[1])
+            and desired_linkable_spec.element_name
+            in ToElementNameSet().transform(
+                self._node_data_set_resolver.get_output_data_set(node).instance_set.spec_set
+            )
+        )
+
+        for first_node_that_could_be_joined in first_nodes_that_could_be_joined:
             data_set_of_first_node_that_could_be_joined = self._node_data_set_resolver.get_output_data_set(
                 first_node_that_could_be_joined
             )
 
-            # When joining on the entity, the first node needs the first and second entity links.
-            if not (
-                self._node_contains_entity(
-                    node=first_node_that_could_be_joined,
-                    entity_reference=desired_linkable_spec.entity_links[0],
-                )
-                and self._node_contains_entity(
-                    node=first_node_that_could_be_joined,
-                    entity_reference=desired_linkable_spec.entity_links[1],
-                )
-            ):
-                continue
-
-            for second_node_that_could_be_joined in nodes:
-                if not (
-                    self._node_contains_entity(
-                        node=second_node_that_could_be_joined,
-                        entity_reference=desired_linkable_spec.entity_links[1],
-                    )
-                ):
-                    continue
-
+            for second_node_that_could_be_joined in second_nodes_that_could_be_joined:
                 # Avoid loops between the same semantic models.
                 if second_node_that_could_be_joined.node_id == first_node_that_could_be_joined.node_id:
                     continue
@@ -508,15 +508,6 @@ class PreJoinNodeProcessor:
                     second_node_that_could_be_joined
                 )
 
-                # If the element name of the linkable spec doesn't exist in the joined data set, then it can't be
-                # useful for obtaining that linkable spec.
-                element_names_in_data_set = ToElementNameSet().transform(
-                    data_set_of_second_node_that_can_be_joined.instance_set.spec_set
-                )
-
-                if desired_linkable_spec.element_name not in element_names_in_data_set:
-                    continue
-
                 # The first and second nodes are joined by this entity
                 entity_reference_to_join_first_and_second_nodes = desired_linkable_spec.entity_links[1]
 
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
 import logging
-import shutil
 import textwrap
-from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -70,16 +67,7 @@ def test_get_dimension_values(cli_runner: MetricFlowCliRunner) -> None:  # noqa:
     assert resp.exit_code == 0
 
 
-@contextmanager
-def create_directory(directory_path: str) -> Iterator[None]:
-    """Creates a temporary directory (errors if it exists) and removes it."""
-    path = Path(directory_path)
-    path.mkdir(parents=True, exist_ok=True)
-    yield
-    shutil.rmtree(path)
-
-
-def test_validate_configs(cli_context: CLIContext) -> None:
+def test_validate_configs(cli_context: CLIContext, tmp_path: Path) -> None:
     """Tests config validation from a manifest stored on the filesystem.
 
     This test is special, because the CLI bypasses the semantic manifest read into the CLIContext and
@@ -90,7 +78,7 @@ def test_validate_configs(cli_context: CLIContext) -> None:
     At any rate, due to the direct read from disk, we have to store a serialized semantic manifest
     in a temporary location. In order to spin up the CLI this requires us to ALSO have a dbt_project.yml
     on the filesystem in the project path. Since we don't want to clobber whatever semantic_manifest.json is
-    in the real filesystem location we do all of this stuff here.
+    in the real filesystem location, a temporary directory is used as the project path.
     """
     yaml_contents = textwrap.dedent(
         """\
@@ -113,25 +101,22 @@ def test_validate_configs(cli_context: CLIContext) -> None:
         apply_transformations=False,
     ).semantic_manifest
 
-    project_directory = Path().absolute()
+    project_directory = tmp_path
     # If the dbt_project.yml doesn't exist in this path location the CLI will throw an exception.
     dummy_project = Path(project_directory, "dbt_project.yml")
     dummy_project.touch()
 
-    try:
-        cli_runner = MetricFlowCliRunner(cli_context=cli_context, project_path=str(project_directory))
-        target_directory = Path(project_directory, "target")
-        with create_directory(target_directory.as_posix()):
-            manifest_file = Path(target_directory, "semantic_manifest.json")
-            manifest_file.write_text(manifest.json())
-
-            resp = cli_runner.run(validate_configs)
+    cli_runner = MetricFlowCliRunner(cli_context=cli_context, project_path=str(project_directory))
+    # The project directory is removed by pytest's tmp_path handling, so the target directory needs no cleanup.
+    target_directory = Path(project_directory, "target")
+    target_directory.mkdir()
+    manifest_file = Path(target_directory, "semantic_manifest.json")
+    manifest_file.write_text(manifest.json())
 
-        assert "ERROR" in resp.output
-        assert resp.exit_code == 1
+    resp = cli_runner.run(validate_configs)
 
-    finally:
-        dummy_project.unlink()
+    assert "ERROR" in resp.output
+    assert resp.exit_code == 1
 
 
 def test_health_checks(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D103
@@ -158,7 +143,6 @@ def test_tutorial_message(cli_runner: MetricFlowCliRunner) -> None:
 
 
 def test_list_entities(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D103
-    # Disabling capsys to resolve error "ValueError: I/O operation on closed file". Better solution TBD.
     resp = cli_runner.run(entities, args=["--metrics", "bookings"])
 
     assert "guest" in resp.output
@@ -168,7 +152,6 @@ def test_list_entities(cli_runner: MetricFlowCliRunner) -> None:  # noqa: D103
 @pytest.mark.sql_engine_snapshot
 def test_saved_query(  # noqa: D103
     request: FixtureRequest,
-    capsys: pytest.CaptureFixture,
     mf_test_configuration: MetricFlowTestConfiguration,
     cli_runner: MetricFlowCliRunner,
     sql_client: SqlClient,
@@ -192,7 +175,6 @@ def test_saved_query(  # noqa: D103
 @pytest.mark.sql_engine_snapshot
 def test_saved_query_with_where(  # noqa: D103
     request: FixtureRequest,
-    capsys: pytest.CaptureFixture,
     mf_test_configuration: MetricFlowTestConfiguration,
     cli_runner: MetricFlowCliRunner,
     sql_client: SqlClient,
@@ -223,7 +205,6 @@ def test_saved_query_with_where(  # noqa: D103
 @pytest.mark.sql_engine_snapshot
 def test_saved_query_with_limit(  # noqa: D103
     request: FixtureRequest,
-    capsys: pytest.CaptureFixture,
     mf_test_configuration: MetricFlowTestConfiguration,
     cli_runner: MetricFlowCliRunner,
     sql_client: SqlClient,
@@ -252,7 +233,6 @@ def test_saved_query_with_limit(  # noqa: D103
 
 
 def test_saved_query_explain(  # noqa: D103
-    capsys: pytest.CaptureFixture,
     mf_test_configuration: MetricFlowTestConfiguration,
     cli_runner: MetricFlowCliRunner,
 ) -> None:
@@ -268,7 +248,6 @@ def test_saved_query_explain(  # noqa: D103
 @pytest.mark.sql_engine_snapshot
 def test_saved_query_with_cumulative_metric(  # noqa: D103
     request: FixtureRequest,
-    capsys: pytest.CaptureFixture,
     mf_test_configuration: MetricFlowTestConfiguration,
     cli_runner: MetricFlowCliRunner,
     sql_client: SqlClient,
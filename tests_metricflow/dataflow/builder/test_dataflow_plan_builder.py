@@ -31,14 +31,18 @@ from metricflow_semantics.test_helpers.metric_time_dimension import (
     MTD_SPEC_QUARTER,
     MTD_SPEC_WEEK,
 )
-from metricflow_semantics.test_helpers.snapshot_helpers import assert_plan_snapshot_text_equal
 
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataset.dataset_classes import DataSet
-from tests_metricflow.dataflow_plan_to_svg import display_graph_if_requested
+from tests_metricflow.snapshot_utils import assert_plan_snapshot_text_equal_and_display_graph
 
 logger = logging.getLogger(__name__)
 
+# Specs that are used by many of the queries below.
+_BOOKINGS_SPEC = MetricSpec(element_name="bookings")
+_BOOKING__IS_INSTANT_SPEC = DimensionSpec(element_name="is_instant", entity_links=(EntityReference("booking"),))
+_LISTING__COUNTRY_LATEST_SPEC = DimensionSpec(element_name="country_latest", entity_links=(EntityReference("listing"),))
+
 
 @pytest.mark.sql_engine_snapshot
 def test_simple_plan(
@@ -49,27 +53,15 @@ def test_simple_plan(
     """Tests a simple plan getting a metric and a local dimension."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"),),
-            dimension_specs=(
-                DimensionSpec(
-                    element_name="is_instant",
-                    entity_links=(EntityReference("booking"),),
-                ),
-            ),
+            metric_specs=(_BOOKINGS_SPEC,),
+            dimension_specs=(_BOOKING__IS_INSTANT_SPEC,),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -82,27 +74,15 @@ def test_primary_entity_dimension(
     """Tests a simple plan getting a metric and a local dimension."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"),),
-            dimension_specs=(
-                DimensionSpec(
-                    element_name="is_instant",
-                    entity_links=(EntityReference(element_name="booking"),),
-                ),
-            ),
+            metric_specs=(_BOOKINGS_SPEC,),
+            dimension_specs=(_BOOKING__IS_INSTANT_SPEC,),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -115,31 +95,18 @@ def test_joined_plan(
     """Tests a plan getting a measure and a joined dimension."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"),),
+            metric_specs=(_BOOKINGS_SPEC,),
             dimension_specs=(
-                DimensionSpec(
-                    element_name="is_instant",
-                    entity_links=(EntityReference("booking"),),
-                ),
-                DimensionSpec(
-                    element_name="country_latest",
-                    entity_links=(EntityReference(element_name="listing"),),
-                ),
+                _BOOKING__IS_INSTANT_SPEC,
+                _LISTING__COUNTRY_LATEST_SPEC,
             ),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -152,7 +119,7 @@ def test_order_by_plan(
     """Tests a plan with an order by."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"),),
+            metric_specs=(_BOOKINGS_SPEC,),
             time_dimension_specs=(MTD_SPEC_DAY,),
             order_by_specs=(
                 OrderBySpec(
@@ -160,24 +127,17 @@ def test_order_by_plan(
                     descending=False,
                 ),
                 OrderBySpec(
-                    instance_spec=MetricSpec(element_name="bookings"),
+                    instance_spec=_BOOKINGS_SPEC,
                     descending=True,
                 ),
             ),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -190,23 +150,16 @@ def test_limit_rows_plan(
     """Tests a plan with a limit to the number of rows returned."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"),),
+            metric_specs=(_BOOKINGS_SPEC,),
             time_dimension_specs=(MTD_SPEC_DAY,),
             limit=1,
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -219,28 +172,16 @@ def test_multiple_metrics_plan(
     """Tests a plan to retrieve multiple metrics."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="booking_value")),
-            dimension_specs=(
-                DimensionSpec(
-                    element_name="is_instant",
-                    entity_links=(EntityReference("booking"),),
-                ),
-            ),
+            metric_specs=(_BOOKINGS_SPEC, MetricSpec(element_name="booking_value")),
+            dimension_specs=(_BOOKING__IS_INSTANT_SPEC,),
             time_dimension_specs=(MTD_SPEC_DAY,),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -254,27 +195,15 @@ def test_single_semantic_model_ratio_metrics_plan(
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
             metric_specs=(MetricSpec(element_name="bookings_per_booker"),),
-            dimension_specs=(
-                DimensionSpec(
-                    element_name="country_latest",
-                    entity_links=(EntityReference(element_name="listing"),),
-                ),
-            ),
+            dimension_specs=(_LISTING__COUNTRY_LATEST_SPEC,),
             time_dimension_specs=(MTD_SPEC_DAY,),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -288,27 +217,15 @@ def test_multi_semantic_model_ratio_metrics_plan(
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
             metric_specs=(MetricSpec(element_name="bookings_per_view"),),
-            dimension_specs=(
-                DimensionSpec(
-                    element_name="country_latest",
-                    entity_links=(EntityReference(element_name="listing"),),
-                ),
-            ),
+            dimension_specs=(_LISTING__COUNTRY_LATEST_SPEC,),
             time_dimension_specs=(MTD_SPEC_DAY,),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -334,17 +251,10 @@ def test_multihop_join_plan(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -364,17 +274,10 @@ def test_where_constrained_plan(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -393,17 +296,10 @@ def test_where_constrained_plan_time_dimension(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -423,17 +319,10 @@ def test_where_constrained_with_common_linkable_plan(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -475,17 +364,10 @@ def test_cumulative_metric_with_window(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -503,17 +385,10 @@ def test_cumulative_metric_no_window_or_grain_with_metric_time(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -531,17 +406,10 @@ def test_cumulative_metric_no_window_or_grain_without_metric_time(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -562,17 +430,10 @@ def test_distinct_values_plan(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan_for_distinct_values(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -592,17 +453,10 @@ def test_distinct_values_plan_with_join(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan_for_distinct_values(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -620,17 +474,10 @@ def test_measure_constraint_plan(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -648,17 +495,10 @@ def test_measure_constraint_with_reused_measure_plan(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -671,25 +511,18 @@ def test_common_semantic_model(
     """Tests a simple plan getting a metric and a local dimension."""
     dataflow_plan = dataflow_plan_builder.build_plan(
         MetricFlowQuerySpec(
-            metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="booking_value")),
+            metric_specs=(_BOOKINGS_SPEC, MetricSpec(element_name="booking_value")),
             dimension_specs=(
                 DataSet.metric_time_dimension_spec(TimeGranularity.DAY),
-                DimensionSpec(element_name="country_latest", entity_links=(EntityReference("listing"),)),
+                _LISTING__COUNTRY_LATEST_SPEC,
             ),
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -707,17 +540,10 @@ def test_derived_metric_offset_window(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -735,17 +561,10 @@ def test_derived_metric_offset_to_grain(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -762,17 +581,10 @@ def test_derived_metric_offset_with_granularity(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -789,17 +601,10 @@ def test_derived_offset_cumulative_metric(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -815,17 +620,10 @@ def test_join_to_time_spine_with_metric_time(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -841,17 +639,10 @@ def test_join_to_time_spine_derived_metric(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -869,17 +660,10 @@ def test_join_to_time_spine_with_non_metric_time(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -892,17 +676,10 @@ def test_dont_join_to_time_spine_if_no_time_dimension_requested(  # noqa: D103
         MetricFlowQuerySpec(metric_specs=(MetricSpec(element_name="bookings_fill_nulls_with_0"),))
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -918,17 +695,10 @@ def test_nested_derived_metric_with_outer_offset(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -940,24 +710,15 @@ def test_min_max_only_categorical(
     """Tests a plan to get the min & max distinct values of a categorical dimension."""
     dataflow_plan = dataflow_plan_builder.build_plan_for_distinct_values(
         query_spec=MetricFlowQuerySpec(
-            dimension_specs=(
-                DimensionSpec(element_name="country_latest", entity_links=(EntityReference(element_name="listing"),)),
-            ),
+            dimension_specs=(_LISTING__COUNTRY_LATEST_SPEC,),
             min_max_only=True,
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -976,17 +737,10 @@ def test_min_max_only_time(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -999,17 +753,10 @@ def test_metric_time_only(  # noqa: D103
         MetricFlowQuerySpec(time_dimension_specs=(MTD_SPEC_DAY,))
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1022,17 +769,10 @@ def test_metric_time_quarter(  # noqa: D103
         MetricFlowQuerySpec(time_dimension_specs=(MTD_SPEC_QUARTER,))
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1051,17 +791,10 @@ def test_metric_time_with_other_dimensions(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1080,17 +813,10 @@ def test_dimensions_with_time_constraint(  # noqa: D103
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1113,17 +839,10 @@ def test_min_max_only_time_year(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1140,17 +859,10 @@ def test_min_max_metric_time(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1167,17 +879,10 @@ def test_min_max_metric_time_week(
         )
     )
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1200,17 +905,10 @@ def test_join_to_time_spine_with_filters(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1231,17 +929,10 @@ def test_offset_window_metric_filter_and_query_have_different_granularities(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1262,17 +953,10 @@ def test_offset_to_grain_metric_filter_and_query_have_different_granularities(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1289,17 +973,10 @@ def test_metric_in_query_where_filter(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1316,17 +993,10 @@ def test_metric_in_metric_where_filter(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1366,17 +1036,10 @@ def test_cumulative_metric_with_non_default_grain(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
 
 
@@ -1393,15 +1056,8 @@ def test_derived_cumulative_metric_with_non_default_grain(
     ).query_spec
     dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
 
-    assert_plan_snapshot_text_equal(
+    assert_plan_snapshot_text_equal_and_display_graph(
         request=request,
         mf_test_configuration=mf_test_configuration,
         plan=dataflow_plan,
-        plan_snapshot_text=dataflow_plan.structure_text(),
-    )
-
-    display_graph_if_requested(
-        request=request,
-        mf_test_configuration=mf_test_configuration,
-        dag_graph=dataflow_plan,
     )
@@ -16,6 +16,7 @@ from metricflow_semantics.test_helpers.snapshot_helpers import (
 from metricflow.dataflow.dataflow_plan import DataflowPlan
 from metricflow.execution.execution_plan import ExecutionPlan
 from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from tests_metricflow.dataflow_plan_to_svg import display_graph_if_requested
 from tests_metricflow.fixtures.setup_fixtures import check_sql_engine_snapshot_marker
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,26 @@ def assert_dataflow_plan_text_equal(  # noqa: D103
     )
 
 
+def assert_plan_snapshot_text_equal_and_display_graph(
+    request: FixtureRequest,
+    mf_test_configuration: MetricFlowTestConfiguration,
+    plan: DataflowPlan,
+) -> None:
+    """Compare the plan against the stored snapshot and display it as an SVG, if requested to do so."""
+    assert_plan_snapshot_text_equal(
+        request=request,
+        mf_test_configuration=mf_test_configuration,
+        plan=plan,
+        plan_snapshot_text=plan.structure_text(),
+    )
+
+    display_graph_if_requested(
+        request=request,
+        mf_test_configuration=mf_test_configuration,
+        dag_graph=plan,
+    )
+
+
 def assert_object_snapshot_equal(  # type: ignore[misc]
     request: FixtureRequest,
     mf_test_configuration: MetricFlowTestConfiguration,